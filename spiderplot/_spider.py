@@ -3,8 +3,10 @@ import pandas as pd
 import seaborn as sns
 import matplotlib as mpl
 import matplotlib.pyplot as plt
+from matplotlib.lines import Line2D
 from matplotlib.patches import Polygon
 import warnings
+from functools import lru_cache
 
 
 def _ensure_axes(ax, enforce):
@@ -13,16 +15,19 @@ def _ensure_axes(ax, enforce):
         fig = plt.gcf()
         if fig.axes:
             ax = plt.gca()
+        elif enforce:
+            # Known to be polar, no need to check the axes created here.
+            return plt.subplot(projection="polar")
     if isinstance(ax, mpl.axes.Axes) and ax.name == "polar":
         return ax
     else:
         if enforce:
-            ax = plt.gca(polar=True)
+            ax = plt.subplot(projection="polar")
             return ax
         else:
             msg = ("Axes must use polar projection. Use one of the following "
                    "statements to ensure polar projection:\n"
-                   "    plt.gca(polar=True)\n"
+                   "    plt.subplot(projection='polar')\n"
                    "    ax = plt.subplot(..., polar=True)\n"
                    "    fig, ax = plt.subplots(subplot_kw={'polar': True})\n"
                    )
@@ -38,17 +43,33 @@ def _format_input_data(x, y, hue, style, data):
         if y is None:
             msg = "In array mode (data=None), argument y must be set."
             raise ValueError(msg)
+        # x is only read from: no need to copy the index of y. Keep it as
+        # pd.Index to preserve its dtype (e.g. timezone-aware datetimes).
         if x is None:
             if isinstance(y, (pd.Series, pd.DataFrame)):
-                x = y.index.copy()
+                x = y.index
             else:
                 x = pd.RangeIndex(len(y))
         else:
             x = pd.Index(x)
-        data = pd.DataFrame(y).set_index(x)
-        data.index.name = "_x"
-        data.columns.name = "category"
-        data = data.reset_index().melt(value_name="_value", id_vars="_x")
+        # Build the long-form table directly instead of the (slow) wide to
+        # long conversion pd.DataFrame(y).set_index(x).reset_index().melt().
+        # The column labels of y form the categories, as with pd.DataFrame(y).
+        if isinstance(y, pd.DataFrame):
+            categories = y.columns
+        elif isinstance(y, pd.Series):
+            categories = pd.Index([0 if y.name is None else y.name])
+        else:
+            categories = None
+        y = np.asarray(y, dtype=np.float64)
+        if y.ndim == 1:
+            y = y[:, np.newaxis]
+        n, k = y.shape
+        if categories is None:
+            categories = np.arange(k)
+        data = pd.DataFrame({"_x": x.take(np.tile(np.arange(n), k)),
+                             "category": np.repeat(np.asarray(categories), n),
+                             "_value": y.reshape(-1, order="F")})
         x = "_x"
         y = "_value"
         # The case where y.shape[1]=d>1 can be resolved in two ways:
@@ -75,7 +96,6 @@ def _format_input_data(x, y, hue, style, data):
         y = name
         fmt = "long"
     elif isinstance(data, pd.DataFrame):
-        data = data.copy()
         if x is None and y is None:
             fmt = "wide"
         else:
@@ -85,6 +105,15 @@ def _format_input_data(x, y, hue, style, data):
     return fmt, x, y, hue, style, data
 
 
+@lru_cache(maxsize=32)
+def _linspace_2pi(n, endpoint):
+    # The same grids are requested repeatedly, e.g. by spiderplot_facet().
+    # The cached arrays are shared and therefore read-only.
+    vals = np.linspace(0, 2*np.pi, n, endpoint=endpoint)
+    vals.setflags(write=False)
+    return vals
+
+
 def _compute_theta(x, y, data,
                    n_ticks_hint=None,
                    is_categorical=True,
@@ -102,34 +131,49 @@ def _compute_theta(x, y, data,
         x = data.get(x,x)
         y = data.get(y,y)
     if x is None:
-        x = list(range(len(y if y is not None else data)))
+        x = np.arange(len(y if y is not None else data))
     if is_categorical:
-        x = pd.Series(x)
-        x_vals = x.unique()
+        # Codes enumerate the unique values in order of appearance. Pass
+        # pandas objects as they are: for categoricals, pd.factorize() then
+        # only factorizes the integer codes. Wrap lists as pd.Series, as
+        # np.asarray() would coerce mixed types.
+        if not isinstance(x, (pd.Series, pd.Index, np.ndarray)):
+            x = pd.Series(x)
+        # Missing values form a category of their own, as with unique().
+        try:
+            codes, x_vals = pd.factorize(x, sort=False, use_na_sentinel=False)
+        except TypeError:
+            # pandas<1.5
+            codes, x_vals = pd.factorize(x, sort=False, na_sentinel=None)
         n_vals = len(x_vals)
-        t_vals = np.linspace(0, 2*np.pi, n_vals, endpoint=is_closed)
-        theta = x.map(dict(zip(x_vals, t_vals)))
+        t_vals = _linspace_2pi(n_vals, endpoint=is_closed)
+        theta = t_vals[codes]
         if n_ticks_hint is not None:
             step = int(max(np.round(len(x_vals)/n_ticks_hint), 1))
             x_vals = x_vals[::step]
             t_vals = t_vals[::step]
     else:
-        x_min = x.min()
-        x_max = x.max()
-        theta = (x-x.min())/(x.max()-x.min())*2*np.pi
+        x = np.asarray(x, dtype=np.float64)
+        x_min = np.nanmin(x)
+        x_max = np.nanmax(x)
+        theta = (x-x_min)/(x_max-x_min)*(2*np.pi)
         if n_ticks_hint is None:
             n_ticks_hint = 8
-        t_vals = np.linspace(0, 2*np.pi, n_ticks_hint, endpoint=False)
-        x_vals = np.linspace(x.min(), x.max(), n_ticks_hint, endpoint=False)
+        t_vals = _linspace_2pi(n_ticks_hint, endpoint=False)
+        x_vals = np.linspace(x_min, x_max, n_ticks_hint, endpoint=False)
     return theta, t_vals, x_vals
 
 
-def _adjust_polar_grid(ax, vals, labels,
+def _adjust_polar_grid(ax, degrees, labels,
                        offset, direction,
                        color):
+    """
+    Args:
+        degrees:        Tick locations on the theta-axis in degrees.
+    """
     ax.set_theta_offset(np.pi/2+offset)
     ax.set_theta_direction(direction)
-    ax.set_thetagrids(vals/np.pi*180, labels, color=color)
+    ax.set_thetagrids(degrees, labels, color=color)
     ax.set_xticklabels(ax.get_xticklabels(), horizontalalignment="center")
     ax.set_rlabel_position(0)
     ax.tick_params(axis="y", which="both", labelsize=8)
@@ -137,8 +181,59 @@ def _adjust_polar_grid(ax, vals, labels,
     ax.set_ylabel(None)
 
 
-def _fill_and_close(ax, data, extent, lines_old,
-                    fill, fillalpha, fillcolor, kwargs):
+def _build_error_polygon(xy, extent):
+    # The polygon consists of the closed upper bound (y+extent) followed
+    # by the closed lower bound (y-extent) in reverse order. Write both
+    # halves into a single buffer instead of concatenating copies.
+    n = len(xy)
+    poly = np.empty((2*(n+1), 2))
+    upper = poly[:n+1]
+    lower = poly[n+1:][::-1]
+    upper[:n] = xy
+    upper[n] = xy[0]
+    lower[:] = upper
+    upper[:n,1] += extent
+    upper[n,1] += extent[0]
+    lower[:n,1] -= extent
+    lower[n,1] -= extent[0]
+    return poly
+
+
+# Keyword arguments that are forwarded to ax.plot() when drawing a single
+# line. "markers" has no effect without style; "legend" is handled below.
+_SINGLE_LINE_KWARGS = {"alpha", "color", "c", "label", "linestyle", "ls",
+                       "linewidth", "lw", "marker", "markersize", "ms",
+                       "markeredgecolor", "mec", "markerfacecolor", "mfc",
+                       "zorder", "markers", "legend"}
+
+
+def _single_line_data(theta, y, data, hue, size, style, kwargs):
+    """
+    Returns the (theta, y) data for drawing a single line with ax.plot(),
+    or None if seaborn is needed: for grouping (hue, size, style),
+    aggregation (repeated x-values) or seaborn-specific kwargs.
+    The line data matches the one of sns.lineplot(), but the axis labels
+    that seaborn sets are not (they are reset by _adjust_polar_grid()).
+    """
+    if hue is not None or size is not None or style is not None:
+        return None
+    if y is None or not set(kwargs) <= _SINGLE_LINE_KWARGS:
+        return None
+    if data is not None:
+        y = data.get(y, y)
+    y = np.asarray(y, dtype=np.float64)
+    # Like seaborn: skip nan-data and sort along the x-axis.
+    mask = ~(np.isnan(theta) | np.isnan(y))
+    theta, y = theta[mask], y[mask]
+    order = np.argsort(theta, kind="stable")
+    theta, y = theta[order], y[order]
+    if np.any(theta[1:] == theta[:-1]):
+        return None
+    return theta, y
+
+
+def _fill_and_close(ax, data, extent, n_lines_old,
+                    fill, fillalpha, fillcolor):
     """
     This is the fragile part and modify/add the artists.
     - Close the lines
@@ -146,39 +241,41 @@ def _fill_and_close(ax, data, extent, lines_old,
     """
     def _draw_poly(xy, color, alpha, ax):
         poly = Polygon(xy, closed=True, fc=color, alpha=alpha)
-        poly.set_fc(color)
         ax.add_patch(poly)
 
+    def _closed(vals):
+        # Append the first element to close the line: a single allocation.
+        vals = np.asarray(vals)
+        ret = np.empty(len(vals)+1, dtype=vals.dtype)
+        ret[:-1] = vals
+        ret[-1] = vals[0]
+        return ret
+
     def _draw_extent(xy, extent, data, color, alpha, ax):
         if data is not None:
             extent = data.get(extent, extent)
-        extent = np.asarray(extent)
-        xy = np.concatenate([xy, [xy[0]]], axis=0)
-        extent = np.append(extent, extent[0])
-        xy1 = xy.copy()
-        xy1[:,1] += extent
-        xy2 = xy.copy()
-        xy2[:,1] -= extent
-        xy = np.concatenate([xy1, xy2[::-1]], axis=0)
-        _draw_poly(xy=xy, color=color, alpha=alpha, ax=ax)
+        # Raises if the shapes don't match; a constant extent is expanded.
+        extent = np.broadcast_to(np.asarray(extent, dtype=np.float64),
+                                 (len(xy),))
+        poly = _build_error_polygon(xy, extent)
+        _draw_poly(xy=poly, color=color, alpha=alpha, ax=ax)
 
     draw_fill = fill
     draw_extent = extent is not None
     close_lines = True
 
-    # If kwargs["label"] exists, the new line artist will carry that label.
-    # Line2D.get_label() might be None, though it should always be a string.
-    has_label, label = "label" in kwargs, kwargs.get("label", None)
-    lines_new = [(l.get_label(),l) for l in ax.lines if
-                 id(l) not in lines_old and
-                 ((has_label and l.get_label()==label) or
-                  (not has_label and l.get_label().startswith("_line")))]
+    # Artists are appended to ax.lines: only the tail holds the new lines.
+    # Skip the empty lines that seaborn may add as legend handles, and the
+    # data lines of error bars (err_style="bars"), labeled "_nolegend_".
+    lines_new = [l for l in ax.lines[n_lines_old:]
+                 if isinstance(l, Line2D) and len(l.get_xdata())
+                 and l.get_label() != "_nolegend_"]
 
     patches = []
-    for _,l in lines_new:
+    for l in lines_new:
         # Filter nan-valued items. This step is necessary for seaborn>=0.10.
         xy = l.get_xydata()
-        mask = np.isnan(xy).any(axis=1)
+        mask = np.isnan(xy[:,0]) | np.isnan(xy[:,1])
         xy = xy[~mask]
         xyp = xy.copy()
 
@@ -203,9 +300,9 @@ def _fill_and_close(ax, data, extent, lines_old,
             # should be used:
             #xdata, ydata = xy.T
             if len(xdata):
-                l.set_xdata(np.concatenate([xdata,[xdata[0]]]))
+                l.set_xdata(_closed(xdata))
             if len(ydata):
-                l.set_ydata(np.concatenate([ydata,[ydata[0]]]))
+                l.set_ydata(_closed(ydata))
 
     # Readjust axes limits to see the patches.
     if draw_extent:
@@ -298,7 +395,7 @@ def spiderplot(x=None, y=None, hue=None, size=None,
                                            n_ticks_hint=n_ticks_hint,
                                            is_categorical=is_categorical)
     # Keep track of newly added lines.
-    lines_old = {id(l) for l in ax.lines}
+    n_lines_old = len(ax.lines)
 
     # Create line plot.
     # Note: this is similar to data.plot.area(), but uses seaborn
@@ -306,33 +403,47 @@ def spiderplot(x=None, y=None, hue=None, size=None,
     # https://github.com/mwaskom/seaborn/issues/2410
 
     if fmt == "wide":
-        index_to_theta = dict(zip(data.index.values, theta))
-        pos_to_label = dict(zip(range(len(theta)), data.index.values))
-        data.index = data.index.map(lambda x: index_to_theta[x])
+        # theta is aligned with the rows of data: replace the index directly.
+        pos_to_label = list(data.index.values)
+        # Copy only here, where data is modified.
+        data = data.copy()
+        data.index = pd.Index(np.asarray(theta))
         ax = sns.lineplot(data=data, ax=ax, **kwargs)
     elif fmt == "long":
-        ax = sns.lineplot(x=theta, y=y, hue=hue, size=size, style=style,
-                          data=data, ax=ax, **kwargs)
+        line = _single_line_data(theta=theta, y=y, data=data, hue=hue,
+                                 size=size, style=style, kwargs=kwargs)
+        if line is not None:
+            # Fast path: draw the single line directly with matplotlib.
+            plot_kwargs = {k: v for k, v in kwargs.items()
+                           if k not in ("markers", "legend")}
+            ax.plot(*line, **plot_kwargs)
+            # Like seaborn: show a legend if there are labeled artists.
+            if kwargs.get("legend", "auto"):
+                handles, _ = ax.get_legend_handles_labels()
+                if handles:
+                    ax.legend()
+        else:
+            ax = sns.lineplot(x=theta, y=y, hue=hue, size=size, style=style,
+                              data=data, ax=ax, **kwargs)
 
     _fill_and_close(ax=ax,
                     data=data,
                     extent=extent,
-                    lines_old=lines_old,
+                    n_lines_old=n_lines_old,
                     fill=fill,
                     fillalpha=fillalpha,
-                    fillcolor=fillcolor,
-                    kwargs=kwargs)
+                    fillcolor=fillcolor)
 
     if _enforce_polar or False:
-        _adjust_polar_grid(ax=ax, vals=t_vals, labels=x_vals,
+        _adjust_polar_grid(ax=ax, degrees=np.degrees(t_vals), labels=x_vals,
                            offset=offset, direction=direction,
                            color="gray")
     if fmt == "wide":
-        ax.set_xticklabels(list(pos_to_label.values()))
+        ax.set_xticklabels(pos_to_label)
 
     if rref is not None:
         rref_kws = {"color":"k", "lw": 0.5} if rref_kws is None else rref_kws
-        t = np.linspace(0, 2*np.pi, 100)
+        t = _linspace_2pi(100, endpoint=True)
         ax.plot(t, np.ones_like(t)*rref, **rref_kws)
     return ax
 
@@ -387,12 +498,14 @@ def spiderplot_facet(data, row=None, col=None, hue=None,
                        offset=offset, direction=direction,
                        _enforce_polar=False)
     grid.fig.subplots_adjust(wspace=.4, hspace=.4)
+    # The tick grid is the same for all facets: compute it only once.
+    _, t_vals, x_vals = _compute_theta(x, y, data,
+                                       is_categorical=is_categorical,
+                                       n_ticks_hint=n_ticks_hint)
+    t_degrees = np.degrees(t_vals)
     for ax in grid.axes.ravel():
-        _, t_vals, x_vals = _compute_theta(x, y, data,
-                                           is_categorical=is_categorical,
-                                           n_ticks_hint=n_ticks_hint)
         _adjust_polar_grid(ax=ax,
-                           vals=t_vals,
+                           degrees=t_degrees,
                            labels=x_vals,
                            offset=offset,
                            direction=direction,